@@ -62,7 +62,7 @@ class DLNAHelper:
             if response.status_code != 200:
                 return None
             
-            root = ET.fromstring(response.text)
+            root = ET.fromstring(response.content)
             result_elem = root.find('.//{*}Result')
             
             if result_elem is None or not result_elem.text:
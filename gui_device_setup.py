@@ -235,7 +235,7 @@ class FindSetupDeviceWorker(QObject):
             try:
                 self.status_message.emit(f"   Versuche {ip}...")
                 controller = SoundTouchController(ip, timeout=2)
-                info = controller.get_info()
+                info = controller.get_info(force_refresh=True)
                 if info:
                     name = info.get('name', 'Unknown')
                     device_id = info.get('deviceID', '')
@@ -1437,7 +1437,7 @@ class DeviceSetupWizard(QDialog):
                 return
             controller = SoundTouchController(self.device_ip, timeout=5)
             # Einfache Prüflogik: ist das Gerät erreichbar, fahren wir fort
-            info = controller.get_info()
+            info = controller.get_info(force_refresh=True)
             if info:
                 self.log("✅ Device is reachable and online on the home WiFi")
                 self.run_on_device_setup()
@@ -15,6 +15,7 @@ Features:
 import sys
 import threading
 import json
+from concurrent.futures import ThreadPoolExecutor
 import os
 from tunein_helper import TuneInHelper
 import device_ssh
@@ -41,6 +42,7 @@ class Signals(QObject):
     device_found = pyqtSignal(str, str)  # name, ip
     status_update = pyqtSignal(str)
     capture_status = pyqtSignal(bool)  # is_capturing
+    volume_level = pyqtSignal(str, str)  # ip, level text
     
 
 class SimpleSoundTouchGUI(QMainWindow):
@@ -58,6 +60,7 @@ class SimpleSoundTouchGUI(QMainWindow):
         self.all_devices = []
         self.group_manager = None
         self.current_volume = 30
+        self._volume_workers = {}  # ip -> Einzel-Thread, damit Klicks pro Lautsprecher in Reihenfolge laufen
         self.devices_file_path = os.path.join(os.path.dirname(__file__), "soundtouch_devices.json")
         self.groups_file_path = os.path.join(os.path.dirname(__file__), "group_config.json")        
         self.saved_groups = []  # Locally saved group configurations
@@ -73,6 +76,7 @@ class SimpleSoundTouchGUI(QMainWindow):
         self.signals.device_found.connect(self._on_device_found)
         self.signals.status_update.connect(self._on_status_update)
         self.signals.capture_status.connect(self._on_capture_status)
+        self.signals.volume_level.connect(self._on_volume_level)
         
         # Apply the single app design ("Midnight")
         self._apply_theme()
@@ -128,7 +132,6 @@ class SimpleSoundTouchGUI(QMainWindow):
                 name = device.get('name', 'Unknown')
                 ip = device.get('ip', '')
                 self.device_combo.addItem(f"{name} ({ip})", userData=ip)
-            self._update_devices_file()
             self.group_manager = SoundTouchGroupManager(devices)
             self.signals.status_update.emit("💾 Loaded saved devices")
             return True
@@ -137,10 +140,11 @@ class SimpleSoundTouchGUI(QMainWindow):
             return False
 
     def _save_devices(self):
-        """Persist discovered devices."""
+        """Persist discovered devices (also used as device list for grouping)."""
         try:
+            data = json.dumps(self.all_devices, indent=2, ensure_ascii=False)
             with open(self.devices_file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.all_devices, f, indent=2, ensure_ascii=False)
+                f.write(data)
         except Exception as e:
             print(f"Failed to save devices: {e}")
     
@@ -217,10 +221,8 @@ class SimpleSoundTouchGUI(QMainWindow):
             groups = self.group_manager.get_groups()
             for i in range(len(groups) - 1, -1, -1):
                 group = groups[i]
-                # Remove all slaves from this group
-                slaves_to_remove = group['slaves'][:]
-                for slave in slaves_to_remove:
-                    self.group_manager.remove_from_group(i, slave)
+                # Remove all slaves from this group (one request to the master)
+                self.group_manager.remove_slaves_from_group(i, group['slaves'][:])
             
             self.active_group = None
             self.signals.status_update.emit("✅ Group deactivated")
@@ -305,37 +307,63 @@ class SimpleSoundTouchGUI(QMainWindow):
         level.setAlignment(Qt.AlignmentFlag.AlignCenter)
         btn_plus = QPushButton("🔊 ＋"); btn_plus.setMaximumWidth(64)
 
-        try:
-            vd = SoundTouchController(ip, timeout=3).get_volume()
-            if vd:
-                level.setText(str(vd.get('actualvolume', '--')))
-        except Exception:
-            pass
-
         self._volume_labels[ip] = level
-        btn_minus.clicked.connect(lambda _, p=ip, l=level: self._set_member_volume(p, -5, l))
-        btn_plus.clicked.connect(lambda _, p=ip, l=level: self._set_member_volume(p, +5, l))
+        threading.Thread(target=self._load_member_volume, args=(ip,), daemon=True).start()
+        btn_minus.clicked.connect(lambda _, p=ip: self._set_member_volume(p, -5))
+        btn_plus.clicked.connect(lambda _, p=ip: self._set_member_volume(p, +5))
         row.addWidget(btn_minus)
         row.addWidget(level)
         row.addWidget(btn_plus)
         row.addStretch()
         self.volume_container.addLayout(row)
 
-    def _set_member_volume(self, ip, delta, level_label=None):
-        """Ändert die Lautstärke eines einzelnen Lautsprechers direkt per IP."""
+    def _on_volume_level(self, ip: str, text: str):
+        """Pegel-Anzeige eines Lautsprechers aktualisieren (GUI-Thread)."""
+        label = self._volume_labels.get(ip)
+        if label is None:
+            return
+        try:
+            label.setText(text)
+        except RuntimeError:
+            # Zeile wurde inzwischen neu aufgebaut, Label existiert nicht mehr
+            pass
+
+    def _load_member_volume(self, ip):
+        """Liest den aktuellen Pegel im Hintergrund (blockiert die GUI nicht)."""
+        try:
+            vd = SoundTouchController(ip, timeout=3).get_volume()
+            if vd:
+                self.signals.volume_level.emit(ip, str(vd.get('actualvolume', '--')))
+        except Exception:
+            pass
+
+    def _set_member_volume(self, ip, delta):
+        """Ändert die Lautstärke eines einzelnen Lautsprechers direkt per IP.
+
+        Die Netzwerkzugriffe laufen im Hintergrund, damit die GUI bei langsamen
+        oder nicht erreichbaren Lautsprechern nicht einfriert. Pro IP gibt es
+        genau einen Worker-Thread: schnelle Klicks werden nacheinander in
+        Klick-Reihenfolge angewendet, keiner liest einen veralteten Wert.
+        """
+        worker = self._volume_workers.get(ip)
+        if worker is None:
+            worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"volume-{ip}")
+            self._volume_workers[ip] = worker
+        worker.submit(self._apply_member_volume, ip, delta)
+
+    def _apply_member_volume(self, ip, delta):
+        """Hintergrund-Teil von _set_member_volume (lesen, setzen, melden)."""
         try:
             c = SoundTouchController(ip, timeout=3)
             vd = c.get_volume()
             if not vd:
-                if level_label:
-                    level_label.setText("--")
+                self.signals.volume_level.emit(ip, "--")
                 self.signals.status_update.emit(f"⚠️ {ip} not reachable (standby?)")
                 return
             current = vd.get('actualvolume', 0)
             new = max(0, min(100, current + delta))
             if c.set_volume(new):
-                if level_label:
-                    level_label.setText(str(new))
+                self.signals.volume_level.emit(ip, str(new))
                 self.signals.status_update.emit(f"🔊 {ip} → {new}")
             else:
                 self.signals.status_update.emit(f"⚠️ Volume ({ip}) failed")
@@ -349,7 +377,7 @@ class SimpleSoundTouchGUI(QMainWindow):
         master_ip = self.active_group.get('master_ip')
         ips = [ip for ip in ([master_ip] + list(self.active_group.get('slave_ips', []))) if ip]
         for ip in ips:
-            self._set_member_volume(ip, delta, self._volume_labels.get(ip))
+            self._set_member_volume(ip, delta)
         self.signals.status_update.emit(f"🔊 Group {'+' if delta >= 0 else ''}{delta}")
 
     def _setup_ui(self):
@@ -988,6 +1016,9 @@ class SimpleSoundTouchGUI(QMainWindow):
         self.device_combo.addItem("Scanning all networks...")
         self.signals.status_update.emit("🔍 Discovering devices on all networks...")
         
+        # Bekannte Geräte zuerst prüfen
+        known_ips = [d.get('ip') for d in (self.all_devices or []) if d.get('ip')]
+        
         def scan():
             all_devices = []
             
@@ -995,6 +1026,7 @@ class SimpleSoundTouchGUI(QMainWindow):
             try:
                 import netifaces
                 scanned_networks = set()
+                networks = []
                 
                 # Virtual/Docker interfaces to skip
                 skip_patterns = [
@@ -1026,20 +1058,35 @@ class SimpleSoundTouchGUI(QMainWindow):
                                         continue
                                     
                                     scanned_networks.add(network)
+                                    networks.append(network)
                                     self.signals.status_update.emit(f"🔍 Scanning {network} ({iface})...")
-                                    
-                                    # Scan this network
-                                    discovery = SoundTouchDiscovery(network=network)
-                                    devices = discovery.scan(max_threads=50, timeout=30)
-                                    
-                                    # Add unique devices
-                                    for device in devices:
-                                        # Check if device already found
-                                        if not any(d['ip'] == device['ip'] for d in all_devices):
-                                            all_devices.append(device)
                     except:
                         continue
                 
+                def scan_network(network):
+                    found = []
+                    try:
+                        # Geräte melden, sobald sie antworten
+                        for device in SoundTouchDiscovery(network=network).scan_iter(
+                                max_threads=50, timeout=30, known_ips=known_ips):
+                            found.append(device)
+                            self.signals.status_update.emit(
+                                f"📡 Found {device.get('name', 'Unknown')} ({device.get('ip', '')})")
+                    except Exception:
+                        pass
+                    return found
+                
+                # Alle Netze gleichzeitig scannen: Dauer = langsamstes Netz statt Summe
+                if networks:
+                    with ThreadPoolExecutor(max_workers=len(networks)) as pool:
+                        results = list(pool.map(scan_network, networks))
+                    for devices in results:
+                        # Add unique devices
+                        for device in devices:
+                            # Check if device already found
+                            if not any(d['ip'] == device['ip'] for d in all_devices):
+                                all_devices.append(device)
+                
                 if not scanned_networks:
                     # Fallback to default scan
                     self.signals.status_update.emit("🔍 Using default network scan...")
@@ -1083,9 +1130,6 @@ class SimpleSoundTouchGUI(QMainWindow):
                 
                 self.signals.status_update.emit(f"✅ Found {len(all_devices)} device(s)")
                 
-                # Update devices list for groups
-                self._update_devices_file()
-                
                 # Initialize group manager
                 if len(all_devices) > 0:
                     self.group_manager = SoundTouchGroupManager(all_devices)
@@ -1294,7 +1338,7 @@ class SimpleSoundTouchGUI(QMainWindow):
 
         # 2) Native Presets ergänzen (falls Slot nicht schon als Radio konfiguriert)
         try:
-            for pr in (self.device.get_presets() or []):
+            for pr in (self.device.get_presets(force_refresh=True) or []):
                 try:
                     nid = int(pr.get('id'))
                 except (TypeError, ValueError):
@@ -1741,14 +1785,6 @@ class SimpleSoundTouchGUI(QMainWindow):
         self.btn_start_capture.setEnabled(not is_capturing)
         self.btn_stop_capture.setEnabled(is_capturing)
     
-    def _update_devices_file(self):
-        """Update the list of available devices for grouping."""
-        try:
-            with open(self.devices_file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.all_devices, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Failed to update devices file: {e}")
-    
     def _open_create_group_dialog(self):
         """Open dialog to create a new saved group."""
         if not self.all_devices or len(self.all_devices) < 2:
@@ -2031,6 +2067,8 @@ class SimpleSoundTouchGUI(QMainWindow):
         """Clean up on close."""
         if self.audio_capture.is_capturing:
             self.audio_capture.stop_capture()
+        for worker in self._volume_workers.values():
+            worker.shutdown(wait=False, cancel_futures=True)
         event.accept()
 
 
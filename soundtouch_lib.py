@@ -6,19 +6,233 @@ Core functionality for discovering and controlling SoundTouch devices.
 Can be used in CLI, REST API, Android apps, or other frontends.
 """
 
+import copy
+import errno
+import logging
 import socket
+import selectors
+import time
 import ipaddress
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError
 import xml.etree.ElementTree as ET
-from xml.sax.saxutils import escape
-from typing import List, Dict, Optional
+from xml.sax.saxutils import escape as _sax_escape
+from typing import List, Dict, Optional, Iterator
 from dlna_helper import DLNAHelper
 from nowplaying_status import NowPlayingStatus
 
+try:
+    import netifaces
+except ImportError:
+    netifaces = None
 
-# Suppress SSL warnings
-requests.packages.urllib3.disable_warnings()
+# Diagnostics of the polled/chatty calls (now playing, source selection);
+# silent unless enabled via enable_verbose()
+log = logging.getLogger(__name__)
+
+try:
+    # Optional: libxml2-based parser, noticeably faster than ElementTree
+    from lxml import etree as _lxml_etree
+except ImportError:
+    _lxml_etree = None
+
+
+if _lxml_etree is not None:
+    _XML_PARSE_ERRORS = (ET.ParseError, _lxml_etree.XMLSyntaxError)
+else:
+    _XML_PARSE_ERRORS = (ET.ParseError,)
+
+# What a device call can reasonably raise: network trouble, malformed XML,
+# unexpected values (int() on an attribute, None/non-int setter arguments)
+_DEVICE_ERRORS = (requests.RequestException, ValueError, TypeError, AttributeError) + _XML_PARSE_ERRORS
+
+_xml_parsers = threading.local()
+
+# /info element paths
+_MAC_PATH = 'networkInfo/macAddress'
+_COMPONENT_PATH = 'components/component'
+
+
+def _info_from_root(root, ip: str, device_type: Optional[str] = None) -> Dict:
+    """Extract the /info fields shared by discovery and SoundTouchController.get_info."""
+    components = []
+    for component in root.iterfind(_COMPONENT_PATH):
+        findtext = component.findtext
+        category = findtext('componentCategory', '')
+        if category:
+            components.append({
+                'category': category,
+                'version': findtext('softwareVersion', ''),
+                'serialNumber': findtext('serialNumber', '')
+            })
+    
+    return {
+        'name': root.findtext('name', 'Unknown'),
+        'type': device_type if device_type is not None else root.findtext('type', 'Unknown'),
+        'ip': ip,
+        'mac': root.findtext(_MAC_PATH, 'Unknown'),
+        'deviceID': root.get('deviceID', 'Unknown'),
+        'components': components,
+    }
+
+
+_QUOTE_ENTITY = {'"': '&quot;'}
+
+
+def escape(value: str) -> str:
+    """XML-escape a value for element text or a double-quoted attribute."""
+    return _sax_escape(value, _QUOTE_ENTITY)
+
+
+def _xml_fromstring(data: bytes):
+    """
+    Parse an XML response body (bytes, so the XML declaration decides the encoding).
+    
+    Uses lxml when installed, otherwise xml.etree. Both return elements
+    with the same find/findtext/findall/get API.
+    """
+    if _lxml_etree is None:
+        return ET.fromstring(data)
+    # lxml parsers are not thread-safe; keep one per thread
+    parser = getattr(_xml_parsers, 'parser', None)
+    if parser is None:
+        parser = _lxml_etree.XMLParser(resolve_entities=False, no_network=True)
+        _xml_parsers.parser = parser
+    return _lxml_etree.fromstring(data, parser=parser)
+
+
+def _create_session(pool_size: int = 32) -> requests.Session:
+    """Create an HTTP session that keeps connections to devices alive."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Controllers are created ad hoc all over the GUIs, so the connection pool lives
+# at module level: every controller for the same device reuses its TCP socket.
+_session = _create_session()
+
+
+class _TTLCache:
+    """
+    Small thread-safe cache for device responses that rarely change.
+    
+    Values are copied on the way in and out, so callers can sort or annotate
+    the lists/dicts they get back without changing what other callers see.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+        return copy.deepcopy(value)
+
+    def set(self, key, value, ttl: Optional[float] = None) -> None:
+        """Store a value; ttl overrides the default lifetime in seconds."""
+        value = copy.deepcopy(value)
+        with self._lock:
+            if len(self._data) >= self.maxsize:
+                self._data.clear()
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+    def invalidate(self, ip: str, port: int, endpoint: Optional[str] = None) -> None:
+        """Drop one endpoint (or all endpoints) cached for a device."""
+        with self._lock:
+            for key in [k for k in self._data if k[:2] == (ip, port)]:
+                if endpoint is None or key[2] == endpoint:
+                    del self._data[key]
+
+    def invalidate_endpoint(self, endpoint: str) -> None:
+        """Drop an endpoint for all devices (e.g. zones, which span several speakers)."""
+        with self._lock:
+            for key in [k for k in self._data if k[2] == endpoint]:
+                del self._data[key]
+
+
+# Capabilities, sources and presets are static or change only through this
+# library, so they are cached per (ip, port, endpoint) across controllers.
+_response_cache = _TTLCache(ttl=300)
+PRESETS_CACHE_TTL = 30  # presets can also be stored via the device buttons
+SOURCES_CACHE_TTL = 30  # source status flips e.g. when Bluetooth pairs
+INFO_CACHE_TTL = 30  # /info only changes on rename, reboot or firmware update
+# Tone/level/zone/Wi-Fi profile: absorbs bursts of repeated UI reads only;
+# the setters drop the entry, changes from other apps show up after this
+SETTINGS_CACHE_TTL = 1.0
+
+# Stream MIME types by URL extension for DLNA playback (default: audio/mpeg)
+_EXT_MIME = {
+    'flac': 'audio/flac',
+    'wav': 'audio/wav',
+    'm4a': 'audio/mp4',
+    'mp4': 'audio/mp4',
+    'aac': 'audio/aac',
+    'ogg': 'audio/ogg',
+    'oga': 'audio/ogg',
+}
+
+RETRY_DELAY = 0.05  # pause before re-sending a request whose connection dropped
+
+LOCAL_IP_TTL = 60  # re-check now and then in case the host changed networks
+_local_ip_cache = (0.0, None)
+
+
+def enable_verbose(enabled: bool = True) -> None:
+    """Show the library's debug output (now playing polls, source selection) on stderr."""
+    logging.basicConfig()
+    log.setLevel(logging.DEBUG if enabled else logging.NOTSET)
+
+
+def get_local_ip() -> Optional[str]:
+    """
+    Return this host's IP on the interface used for the default route.
+    
+    Uses a UDP connect (no packet is sent) and caches the result for
+    LOCAL_IP_TTL seconds so playback paths don't repeat the lookup.
+    
+    Returns:
+        IP address string, or None if no route is available
+    """
+    global _local_ip_cache
+    checked_at, local_ip = _local_ip_cache
+    if local_ip and time.monotonic() - checked_at < LOCAL_IP_TTL:
+        return local_ip
+    try:
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            s.connect(("8.8.8.8", 80))
+            local_ip = s.getsockname()[0]
+        finally:
+            s.close()
+    except OSError:
+        return None
+    _local_ip_cache = (time.monotonic(), local_ip)
+    return local_ip
+
+
+def _map_concurrently(func, items: list, max_workers: int = 16) -> list:
+    """Apply func to every item in parallel (one request per device), keeping order."""
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(func, items))
 
 
 class SoundTouchDiscovery:
@@ -26,6 +240,16 @@ class SoundTouchDiscovery:
     
     DEFAULT_PORT = 8090
     TIMEOUT = 2
+    # TCP connect probe before the /info request. Generous on purpose: speakers
+    # in Wi-Fi power save or needing a fresh ARP lookup can take well over
+    # 300 ms, and a whole batch shares one deadline (~1 s per PROBE_BATCH hosts)
+    PROBE_TIMEOUT = 1.0
+    PROBE_BATCH = 128    # sockets opened at once by the connect probe
+    # connect_ex() results meaning "still connecting" (10035 = WSAEWOULDBLOCK)
+    _CONNECT_PENDING = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY, 10035}
+    SSDP_ADDR = ('239.255.255.250', 1900)
+    SSDP_ST = 'urn:schemas-upnp-org:device:MediaRenderer:1'
+    SSDP_TIMEOUT = 1.5
     
     def __init__(self, network: Optional[str] = None, port: int = DEFAULT_PORT):
         """
@@ -36,31 +260,38 @@ class SoundTouchDiscovery:
             port: Port to scan (default: 8090)
         """
         self.port = port
-        self.network = network
         self.devices = []
-        self.lock = threading.Lock()
-        
-        if network is None:
-            self.network = self._get_local_network()
+        self.network = network if network is not None else self._get_local_network()
+    
+    @property
+    def network(self) -> str:
+        """Network CIDR to scan."""
+        return self._network
+    
+    @network.setter
+    def network(self, value: str) -> None:
+        # Parse/validate once; scan_iter() reports an invalid CIDR
+        self._network = value
+        try:
+            self._ip_network = ipaddress.ip_network(value, strict=False)
+        except ValueError:
+            self._ip_network = None
     
     def _get_local_network(self) -> str:
         """Auto-detect local network using socket."""
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            local_ip = s.getsockname()[0]
-            s.close()
-            
-            # Convert to /24 subnet
-            parts = local_ip.split('.')
-            return f"{parts[0]}.{parts[1]}.{parts[2]}.0/24"
-        except Exception:
+        local_ip = get_local_ip()
+        if not local_ip:
             return "192.168.1.0/24"
+        
+        # Convert to /24 subnet
+        parts = local_ip.split('.')
+        return f"{parts[0]}.{parts[1]}.{parts[2]}.0/24"
     
     def _get_wifi_network(self) -> str:
         """Get WiFi network specifically (prefer WLAN over Ethernet)."""
+        if netifaces is None:
+            return self._get_local_network()
         try:
-            import netifaces
             # Look for WiFi interfaces first
             wifi_interfaces = []
             for iface in netifaces.interfaces():
@@ -81,68 +312,165 @@ class SoundTouchDiscovery:
             
             # Fallback to default behavior if no WiFi found
             return self._get_local_network()
-        except ImportError:
-            # netifaces not available, use default
-            return self._get_local_network()
         except Exception:
             return self._get_local_network()
     
-    def _scan_host(self, ip: str) -> None:
+    def ssdp_discover(self, timeout: float = SSDP_TIMEOUT) -> List[str]:
+        """
+        Find UPnP media renderers with a single SSDP M-SEARCH multicast.
+        
+        SoundTouch speakers announce themselves as MediaRenderer (DLNA on
+        port 8091). Other renderers answer too; callers still check /info.
+        
+        Args:
+            timeout: How long to collect responses (seconds)
+            
+        Returns:
+            IP addresses that answered, in order of arrival
+        """
+        msg = (
+            'M-SEARCH * HTTP/1.1\r\n'
+            f'HOST: {self.SSDP_ADDR[0]}:{self.SSDP_ADDR[1]}\r\n'
+            'MAN: "ssdp:discover"\r\n'
+            'MX: 1\r\n'
+            f'ST: {self.SSDP_ST}\r\n'
+            '\r\n'
+        ).encode('ascii')
+        
+        found = []
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 2)
+                sock.sendto(msg, self.SSDP_ADDR)
+                deadline = time.monotonic() + timeout
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    sock.settimeout(remaining)
+                    try:
+                        _, (ip, _) = sock.recvfrom(2048)
+                    except socket.timeout:
+                        break
+                    if ip not in found:
+                        found.append(ip)
+        except OSError as e:
+            print(f"SSDP discovery failed: {e}")
+        return found
+    
+    def _probe_ports(self, ips: List[str], deadline: Optional[float] = None) -> List[str]:
+        """
+        Find the hosts that accept a TCP connection on the API port.
+        
+        Most hosts on a LAN don't listen on 8090, so instead of one blocking
+        connect per host, start non-blocking connects for a whole batch and
+        wait for all of them with a single selector.
+        
+        Args:
+            ips: Host addresses to probe
+            deadline: time.monotonic() value after which no more hosts are
+                probed (default: probe all)
+            
+        Returns:
+            Addresses with the port open, in the order of ips
+        """
+        open_ips = set()
+        sel = selectors.DefaultSelector()
+        socks = []
+        try:
+            for ip in ips:
+                if len(socks) >= self.PROBE_BATCH:
+                    self._finish_probes(sel, socks, open_ips, deadline)
+                    if deadline is not None and time.monotonic() >= deadline:
+                        break
+                try:
+                    self._start_probe(ip, sel, socks, open_ips)
+                except OSError as e:
+                    if not socks:
+                        print(f"Port probe of {ip} failed: {e}")
+                        continue
+                    # Usually out of file descriptors (EMFILE): finish the
+                    # connects already started, then try this host once more
+                    self._finish_probes(sel, socks, open_ips, deadline)
+                    try:
+                        self._start_probe(ip, sel, socks, open_ips)
+                    except OSError as e:
+                        print(f"Port probe of {ip} failed: {e}")
+            self._finish_probes(sel, socks, open_ips, deadline)
+        finally:
+            sel.close()
+            for sock in socks:
+                sock.close()
+        return [ip for ip in ips if ip in open_ips]
+    
+    def _start_probe(self, ip: str, sel, socks: list, open_ips: set) -> None:
+        """Start a non-blocking connect to ip and register it with the selector."""
+        family = socket.AF_INET6 if ':' in ip else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        socks.append(sock)
+        sock.setblocking(False)
+        err = sock.connect_ex((ip, self.port))
+        if err == 0:
+            open_ips.add(ip)
+        elif err in self._CONNECT_PENDING:
+            sel.register(sock, selectors.EVENT_WRITE, ip)
+    
+    def _finish_probes(self, sel, socks: list, open_ips: set,
+                       scan_deadline: Optional[float] = None) -> None:
+        """Wait for the pending connects of a batch, then close its sockets."""
+        deadline = time.monotonic() + self.PROBE_TIMEOUT
+        if scan_deadline is not None:
+            deadline = min(deadline, scan_deadline)
+        try:
+            while sel.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in sel.select(remaining):
+                    sel.unregister(key.fileobj)
+                    if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        open_ips.add(key.data)
+        except OSError as e:
+            print(f"Port probe failed: {e}")
+        finally:
+            for key in list(sel.get_map().values()):
+                sel.unregister(key.fileobj)
+            for sock in socks:
+                sock.close()
+            socks.clear()
+    
+    def _scan_host(self, ip: str) -> Optional[Dict]:
         """Scan a single host for SoundTouch API."""
         try:
             url = f"http://{ip}:{self.port}/info"
-            response = requests.get(url, timeout=self.TIMEOUT, verify=False)
-            response.encoding = 'utf-8'  # Ensure UTF-8 decoding
+            # Shared pool: the controller created for a found device
+            # reuses the connection opened here
+            response = _session.get(url, timeout=self.TIMEOUT)
             
             if response.status_code == 200:
-                device_info = self._parse_info_response(response.text, ip)
-                if device_info:
-                    with self.lock:
-                        self.devices.append(device_info)
+                return self._parse_info_response(response.content, ip)
         except (requests.ConnectionError, requests.Timeout, Exception):
             pass
+        return None
     
-    def _parse_info_response(self, xml_text: str, ip: str) -> Optional[Dict]:
-        """Parse the /info XML response."""
+    def _parse_info_response(self, xml_text, ip: str) -> Optional[Dict]:
+        """Parse the /info XML response (raw bytes or str)."""
         try:
-            # Ensure UTF-8 encoding for XML parsing
-            if isinstance(xml_text, bytes):
-                xml_text = xml_text.decode('utf-8')
-            root = ET.fromstring(xml_text.encode('utf-8') if isinstance(xml_text, str) else xml_text)
+            if isinstance(xml_text, str):
+                xml_text = xml_text.encode('utf-8')
+            root = _xml_fromstring(xml_text)
             
-            name = root.findtext('name', 'Unknown')
             device_type = root.findtext('type', 'Unknown')
-            device_id = root.get('deviceID', 'Unknown')
-            marge_account = root.findtext('margeAccountUUID', '')
-            
-            network_info = root.find('networkInfo')
-            mac_address = 'Unknown'
-            if network_info is not None:
-                mac_address = network_info.findtext('macAddress', 'Unknown')
-            
-            components = []
-            for component in root.findall('components/component'):
-                comp_data = {
-                    'category': component.findtext('componentCategory', ''),
-                    'version': component.findtext('softwareVersion', ''),
-                    'serialNumber': component.findtext('serialNumber', '')
-                }
-                if comp_data['category']:
-                    components.append(comp_data)
-            
-            # Verify it's a Bose SoundTouch device
-            if self._is_soundtouch_device(device_type, root):
-                return {
-                    'name': name,
-                    'type': device_type,
-                    'ip': ip,
-                    'mac': mac_address,
-                    'deviceID': device_id,
-                    'margeAccount': marge_account,
-                    'components': components,
-                    'url': f"http://{ip}:{self.port}"
-                }
-        except ET.ParseError:
+            
+            # Verify it's a Bose SoundTouch device before extracting the rest
+            if not self._is_soundtouch_device(device_type, root):
+                return None
+            
+            device = _info_from_root(root, ip, device_type)
+            device['margeAccount'] = root.findtext('margeAccountUUID', '')
+            device['url'] = f"http://{ip}:{self.port}"
+            return device
+        except _XML_PARSE_ERRORS:
             pass
         
         return None
@@ -157,53 +485,115 @@ class SoundTouchDiscovery:
         
         return False
     
-    def scan(self, max_threads: int = 50, timeout: int = 60) -> List[Dict]:
+    @staticmethod
+    def _host_ips(network) -> List[str]:
+        """Host addresses of a network as strings, without an IPv4Address object per host."""
+        if network.version != 4 or network.num_addresses <= 2:
+            return [str(ip) for ip in network.hosts()]
+        first = int(network.network_address) + 1
+        last = int(network.broadcast_address)
+        return [socket.inet_ntoa(n.to_bytes(4, 'big')) for n in range(first, last)]
+    
+    def scan_iter(self, max_threads: int = 50, timeout: int = 60,
+                  known_ips: Optional[List[str]] = None,
+                  use_ssdp: bool = True) -> Iterator[Dict]:
+        """
+        Scan the network and yield each device as soon as it answers.
+        
+        Args:
+            max_threads: Maximum number of concurrent probes
+            timeout: Maximum time to wait for the whole scan (seconds)
+            known_ips: Previously seen device IPs; checked right away, while
+                the rest of the network is still being probed
+            use_ssdp: Ask via SSDP while the port probe runs and check the
+                responders right away (the full sweep still runs)
+            
+        Yields:
+            Device dicts in the order the hosts respond
+            
+        Raises:
+            ValueError: If the network CIDR is invalid
+        """
+        network = self._ip_network
+        if network is None:
+            raise ValueError(f"Invalid network: {self.network}")
+        ips = self._host_ips(network)
+        hosts = set(ips)
+        known = [ip for ip in dict.fromkeys(known_ips or ()) if ip in hosts]
+        checked = set(known)
+        
+        deadline = time.monotonic() + timeout
+        print(f"Scanning {len(ips)} IPs in {self.network}...")
+        
+        # A fixed pool of workers keeps max_threads requests in flight at all
+        # times; two extra workers run the port probe and SSDP side by side.
+        executor = ThreadPoolExecutor(max_workers=max(1, max_threads) + 2)
+        try:
+            # Only hosts with the port open get the (much slower) /info request
+            probe = executor.submit(self._probe_ports, [ip for ip in ips if ip not in checked], deadline)
+            ssdp = executor.submit(self.ssdp_discover) if use_ssdp else None
+            
+            # Previously seen devices don't need the probe to be found again
+            yield from self._scan_hosts(executor, known, deadline)
+            
+            if ssdp is not None:
+                # Whichever finishes first wins: on a typical LAN the SSDP
+                # answers arrive well before the probe of the whole subnet is
+                # done, but the scan never waits on SSDP once the probe is back
+                wait([probe, ssdp], timeout=self._remaining(deadline), return_when=FIRST_COMPLETED)
+                if ssdp.done() and not probe.done():
+                    # Other UPnP renderers (TVs, Sonos, ...) answer too and are
+                    # filtered by _scan_host; speakers that missed the lossy
+                    # multicast are still found by the sweep below
+                    responders = [ip for ip in dict.fromkeys(ssdp.result())
+                                  if ip in hosts and ip not in checked]
+                    if responders:
+                        print(f"SSDP: {len(responders)} responder(s) in {self.network}, checking them first")
+                    checked.update(responders)
+                    yield from self._scan_hosts(executor, responders, deadline)
+            
+            open_ips = probe.result(timeout=self._remaining(deadline))
+            yield from self._scan_hosts(executor, [ip for ip in open_ips if ip not in checked], deadline)
+        except FuturesTimeoutError:
+            print(f"Scan timeout reached after {timeout}s")
+        finally:
+            # Don't block on stragglers; hosts not started yet are dropped
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    @staticmethod
+    def _remaining(deadline: float) -> float:
+        """Seconds left until a time.monotonic() deadline (never negative)."""
+        return max(0.0, deadline - time.monotonic())
+    
+    def _scan_hosts(self, executor: ThreadPoolExecutor, ips: List[str],
+                    deadline: float) -> Iterator[Dict]:
+        """Request /info from each host on the pool and yield devices as they answer."""
+        futures = [executor.submit(self._scan_host, ip) for ip in ips]
+        for future in as_completed(futures, timeout=self._remaining(deadline)):
+            device = future.result()
+            if device:
+                yield device
+    
+    def scan(self, max_threads: int = 50, timeout: int = 60,
+             known_ips: Optional[List[str]] = None,
+             use_ssdp: bool = True) -> List[Dict]:
         """
         Scan the network for SoundTouch devices.
         
         Args:
-            max_threads: Maximum number of concurrent threads
-            timeout: Maximum time to wait for all threads (seconds)
+            max_threads: Maximum number of concurrent probes
+            timeout: Maximum time to wait for the whole scan (seconds)
+            known_ips: Previously seen device IPs; checked right away, while
+                the rest of the network is still being probed
+            use_ssdp: Ask via SSDP while the port probe runs and check the
+                responders right away (the full sweep still runs)
             
         Returns:
             List of discovered devices
         """
         try:
-            import time
-            network = ipaddress.ip_network(self.network, strict=False)
-            ips = list(network.hosts())
-            
-            print(f"Scanning {len(ips)} IPs in {self.network}...")
-            
-            threads = []
-            start_time = time.time()
-            
-            for ip in ips:
-                # Check timeout
-                if time.time() - start_time > timeout:
-                    print(f"Scan timeout reached after {timeout}s")
-                    break
-                
-                # Wait if too many threads
-                wait_count = 0
-                while len(threading.enumerate()) > max_threads + 1:
-                    time.sleep(0.1)
-                    wait_count += 1
-                    # Prevent infinite wait
-                    if wait_count > 50:  # 5 seconds max wait
-                        break
-                
-                thread = threading.Thread(target=self._scan_host, args=(str(ip),))
-                thread.daemon = True
-                thread.start()
-                threads.append(thread)
-            
-            # Wait for threads with timeout
-            remaining_time = timeout - (time.time() - start_time)
-            for thread in threads:
-                if remaining_time <= 0:
-                    break
-                thread.join(timeout=max(0.5, remaining_time / max(len(threads), 1)))
+            for device in self.scan_iter(max_threads, timeout, known_ips, use_ssdp):
+                self.devices.append(device)
             
             print(f"Scan complete. Found {len(self.devices)} devices.")
             return self.devices
@@ -243,8 +633,21 @@ class SoundTouchController:
         'aux_input': 'AUX_INPUT',
         'aux': 'AUX_INPUT',
     }
-    
-    def __init__(self, ip: str, port: int = 8090, timeout: int = 5):
+    # Sorted once at import; the key table never changes at runtime
+    _AVAILABLE_KEYS = tuple(sorted(KEYS))
+    
+    # Request bodies of the frequently called setters (volume slider, keys)
+    _VOLUME_TPL = '<volume>%d</volume>'
+    _BASS_TPL = '<bass>%s</bass>'
+    _VALUE_TPL = '<%s value="%s" />'  # %s: CLI/REST callers pass strings
+    _MEMBER_TPL = '<member ipaddress="%s">%s</member>'
+    _WIFI_PROFILE_TPL = ('<AddWirelessProfile timeout="%d"><profile ssid="%s" password="%s" '
+                         'securityType="%s" /></AddWirelessProfile>')
+    _KEY_TPL = '<key state="%s" sender="%s">%s</key>'
+    _XML_HEADERS = {'Content-Type': 'application/xml'}
+    
+    def __init__(self, ip: str, port: int = 8090, timeout: int = 5,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the controller.
         
@@ -252,14 +655,41 @@ class SoundTouchController:
             ip: IP address of the SoundTouch device
             port: Port (default: 8090)
             timeout: HTTP timeout in seconds (default: 5)
+            session: HTTP session to use (default: shared keep-alive pool)
         """
         self.ip = ip
         self.port = port
         self.base_url = f"http://{ip}:{port}"
         self.timeout = timeout
+        self.session = session if session is not None else _session
         self.dlna_port = 8091  # Bose DLNA/UPnP AVTransport port
         self.last_error = ''
         self.override_nowplaying = None  # Fallback metadata for DLNA/manual streams
+        self._dlna_helpers = {}  # DLNA server IP -> DLNAHelper
+
+    def _get_dlna(self, server_ip: Optional[str] = None) -> DLNAHelper:
+        """Return the DLNA helper for a server (default: the device itself), created once."""
+        key = server_ip or self.ip
+        dlna = self._dlna_helpers.get(key)
+        if dlna is None:
+            dlna = DLNAHelper(dlna_server_ip=key, device_ip=self.ip, device_dlna_port=self.dlna_port)
+            self._dlna_helpers[key] = dlna
+        return dlna
+
+    def clear_cache(self) -> None:
+        """Forget cached capabilities/sources/presets of this device (e.g. after a reboot)."""
+        _response_cache.invalidate(self.ip, self.port)
+
+    def close(self) -> None:
+        """Close a caller-supplied session; the shared pool stays open."""
+        if self.session is not _session:
+            self.session.close()
+
+    def __enter__(self) -> 'SoundTouchController':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     def _set_error(self, msg: str) -> None:
         """Store last error for debugging and log to stdout."""
@@ -270,6 +700,58 @@ class SoundTouchController:
             except Exception:
                 pass
 
+    def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """
+        Send a request to an API endpoint, retrying once if the connection drops.
+        
+        Stale keep-alive sockets and flaky firmware occasionally reset a
+        request; a quick second attempt is cheaper than failing the call.
+        Only an established connection that was dropped is retried: failed
+        connects (refused, unreachable) and timeouts are raised right away,
+        so an offline device never costs twice the configured timeout.
+        """
+        url = f"{self.base_url}/{endpoint}"
+        try:
+            return self.session.request(method, url, timeout=self.timeout, **kwargs)
+        except requests.ConnectionError as e:
+            # requests wraps a dropped connection as ProtocolError (e.g.
+            # RemoteDisconnected); connect failures arrive as MaxRetryError
+            if isinstance(e, requests.Timeout) or not (e.args and isinstance(e.args[0], ProtocolError)):
+                raise
+            time.sleep(RETRY_DELAY)
+            return self.session.request(method, url, timeout=self.timeout, **kwargs)
+
+    def _get_xml(self, endpoint: str):
+        """
+        GET an API endpoint and parse the XML response.
+        
+        Args:
+            endpoint: Path below the base URL (e.g. 'volume')
+            
+        Returns:
+            Root element, or None if the device answered with an HTTP error
+        """
+        response = self._request('GET', endpoint)
+        if response.status_code != 200:
+            return None
+        return _xml_fromstring(response.content)
+
+    def _post_xml(self, endpoint: str, xml_body) -> bool:
+        """
+        POST an XML body to an API endpoint.
+        
+        Args:
+            endpoint: Path below the base URL (e.g. 'volume')
+            xml_body: Request body; str is sent UTF-8 encoded
+            
+        Returns:
+            True if the device answered with HTTP 200
+        """
+        if isinstance(xml_body, str):
+            xml_body = xml_body.encode('utf-8')
+        response = self._request('POST', endpoint, data=xml_body, headers=self._XML_HEADERS)
+        return response.status_code == 200
+
     def is_reachable(self, timeout: int = 2) -> bool:
         """
         Quick check if device is reachable.
@@ -282,51 +764,29 @@ class SoundTouchController:
         """
         try:
             url = f"{self.base_url}/info"
-            response = requests.get(url, timeout=timeout, verify=False)
+            response = self.session.get(url, timeout=timeout)
             return response.status_code == 200
         except Exception:
             return False
     
-    def get_info(self) -> Optional[Dict]:
-        """Get device info from /info.
+    def get_info(self, force_refresh: bool = False) -> Optional[Dict]:
+        """Get device info from /info (cached briefly).
         Returns parsed dict with name, type, ip, mac and components.
+        Pass force_refresh=True when the call doubles as a reachability check.
         """
+        cache_key = (self.ip, self.port, 'info')
+        if not force_refresh:
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                return cached
         try:
-            url = f"{self.base_url}/info"
-            response = requests.get(url, timeout=self.timeout, verify=False)
-            if response.status_code != 200:
+            root = self._get_xml('info')
+            if root is None:
                 return None
 
-            root = ET.fromstring(response.text)
-
-            name = root.findtext('name', 'Unknown')
-            device_type = root.findtext('type', 'Unknown')
-            device_id = root.get('deviceID', 'Unknown')
-
-            network_info = root.find('networkInfo')
-            mac_address = 'Unknown'
-            if network_info is not None:
-                mac_address = network_info.findtext('macAddress', 'Unknown')
-
-            components = []
-            for component in root.findall('components/component'):
-                comp_data = {
-                    'category': component.findtext('componentCategory', ''),
-                    'version': component.findtext('softwareVersion', ''),
-                    'serialNumber': component.findtext('serialNumber', '')
-                }
-                if comp_data['category']:
-                    components.append(comp_data)
-
-            # verify type contains "SoundTouch" or known categories
-            return {
-                'name': name,
-                'type': device_type,
-                'ip': self.ip,
-                'mac': mac_address,
-                'deviceID': device_id,
-                'components': components,
-            }
+            info = _info_from_root(root, self.ip)
+            _response_cache.set(cache_key, info, ttl=INFO_CACHE_TTL)
+            return info
         except Exception:
             return None
     
@@ -341,34 +801,11 @@ class SoundTouchController:
         Returns:
             True if successful, False otherwise
         """
-        if key.lower() not in self.KEYS:
+        key_value = self.KEYS.get(key.lower())
+        if key_value is None:
             return False
         
-        key_value = self.KEYS[key.lower()]
-        
-        try:
-            url = f"{self.base_url}/key"
-            headers = {'Content-Type': 'application/xml'}
-            
-            # Send press and release as two separate calls (best practice)
-            for state in ['press', 'release']:
-                xml_body = f'<key state="{state}" sender="{sender}">{key_value}</key>'
-                
-                response = requests.post(
-                    url,
-                    data=xml_body,
-                    headers=headers,
-                    timeout=self.timeout,
-                    verify=False
-                )
-                
-                if response.status_code != 200:
-                    return False
-            
-            return True
-        
-        except Exception:
-            return False
+        return self.press_key(key_value, sender)
     
     def get_nowplaying(self) -> Optional[NowPlayingStatus]:
         """
@@ -380,11 +817,12 @@ class SoundTouchController:
         """
         try:
             url = f"{self.base_url}/now_playing"
-            response = requests.get(url, timeout=self.timeout, verify=False)
+            response = self.session.get(url, timeout=self.timeout)
             
             if response.status_code == 200:
-                print(f"[DEBUG] now_playing response:\n{response.text}\n")
-                root = ET.fromstring(response.text)
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("now_playing response:\n%s", response.text)
+                root = _xml_fromstring(response.content)
                 status = NowPlayingStatus(root=root)
                 
                 # If we're streaming via DLNA/UPNP and have override metadata, use that
@@ -394,7 +832,7 @@ class SoundTouchController:
                     override_copy = self.override_nowplaying.copy()
                     override_copy['playStatus'] = status.play_status  # Use property, not attribute
                     override_copy['position'] = status.position
-                    print(f"[DEBUG] Using override metadata: {override_copy.get('track')} - {override_copy.get('artist')}")
+                    log.debug("Using override metadata: %s - %s", override_copy.get('track'), override_copy.get('artist'))
                     return NowPlayingStatus(**override_copy)
                 
                 # If device returns invalid/unknown but we have override (e.g., DLNA fallback), prefer override
@@ -406,14 +844,14 @@ class SoundTouchController:
                         needs_override = True
                     if needs_override:
                         return NowPlayingStatus(**self.override_nowplaying)
-                print(f"[DEBUG] Parsed: track={status.track}, duration={status.duration}, position={status.position}")
+                log.debug("Parsed: track=%s, duration=%s, position=%s", status.track, status.duration, status.position)
                 return status
             # HTTP error; fallback to override if present
             if self.override_nowplaying:
                 return NowPlayingStatus(**self.override_nowplaying)
             return None
         except Exception as e:
-            print(f"[DEBUG] get_nowplaying error: {e}")
+            log.debug("get_nowplaying error: %s", e)
             if self.override_nowplaying:
                 return NowPlayingStatus(**self.override_nowplaying)
             return None
@@ -421,17 +859,14 @@ class SoundTouchController:
     def get_volume(self) -> Optional[dict]:
         """Get current volume settings."""
         try:
-            url = f"{self.base_url}/volume"
-            response = requests.get(url, timeout=self.timeout, verify=False)
-            
-            if response.status_code == 200:
-                root = ET.fromstring(response.text)
-                return {
-                    'targetvolume': int(root.findtext('targetvolume', '0')),
-                    'actualvolume': int(root.findtext('actualvolume', '0')),
-                    'muteenabled': root.findtext('muteenabled', 'false').lower() == 'true',
-                }
-            return None
+            root = self._get_xml('volume')
+            if root is None:
+                return None
+            return {
+                'targetvolume': int(root.findtext('targetvolume', '0')),
+                'actualvolume': int(root.findtext('actualvolume', '0')),
+                'muteenabled': root.findtext('muteenabled', 'false').lower() == 'true',
+            }
         except Exception:
             return None
     
@@ -449,51 +884,47 @@ class SoundTouchController:
         try:
             if not 0 <= volume <= 100:
                 return False
-            
-            url = f"{self.base_url}/volume"
-            headers = {'Content-Type': 'application/xml'}
 
             # Zum SETZEN erwartet die Bose-API den Wert als Textinhalt von <volume>,
             # NICHT <targetvolume> (das ist nur im GET-Response). Falsches Format
             # wird mit HTTP 200 quittiert, aber ignoriert.
-            xml_body = f'<volume>{volume}</volume>'
+            xml_body = (self._VOLUME_TPL % volume).encode('ascii')
 
-            response = requests.post(url, data=xml_body, headers=headers, timeout=self.timeout, verify=False)
-            return response.status_code == 200
+            return self._post_xml('volume', xml_body)
         except Exception:
             return False
     
     def get_bass_capabilities(self) -> Optional[dict]:
-        """Get bass capabilities of the device."""
+        """Get bass capabilities of the device (cached)."""
+        cache_key = (self.ip, self.port, 'bassCapabilities')
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
         try:
-            url = f"{self.base_url}/bassCapabilities"
-            response = requests.get(url, timeout=self.timeout, verify=False)
-            
-            if response.status_code == 200:
-                root = ET.fromstring(response.text)
-                return {
-                    'bassAvailable': root.findtext('bassAvailable', 'false').lower() == 'true',
-                    'bassMin': int(root.findtext('bassMin', '0')),
-                    'bassMax': int(root.findtext('bassMax', '0')),
-                    'bassDefault': int(root.findtext('bassDefault', '0')),
-                }
-            return None
+            root = self._get_xml('bassCapabilities')
+            if root is None:
+                return None
+            caps = {
+                'bassAvailable': root.findtext('bassAvailable', 'false').lower() == 'true',
+                'bassMin': int(root.findtext('bassMin', '0')),
+                'bassMax': int(root.findtext('bassMax', '0')),
+                'bassDefault': int(root.findtext('bassDefault', '0')),
+            }
+            _response_cache.set(cache_key, caps)
+            return caps
         except Exception:
             return None
     
     def get_bass(self) -> Optional[dict]:
         """Get current bass setting."""
         try:
-            url = f"{self.base_url}/bass"
-            response = requests.get(url, timeout=self.timeout, verify=False)
-            
-            if response.status_code == 200:
-                root = ET.fromstring(response.text)
-                return {
-                    'targetbass': int(root.findtext('targetbass', '0')),
-                    'actualbass': int(root.findtext('actualbass', '0')),
-                }
-            return None
+            root = self._get_xml('bass')
+            if root is None:
+                return None
+            return {
+                'targetbass': int(root.findtext('targetbass', '0')),
+                'actualbass': int(root.findtext('actualbass', '0')),
+            }
         except Exception:
             return None
     
@@ -508,12 +939,9 @@ class SoundTouchController:
             True if successful
         """
         try:
-            url = f"{self.base_url}/bass"
-            headers = {'Content-Type': 'application/xml'}
-            xml_body = f'<bass>{bass}</bass>'
+            xml_body = (self._BASS_TPL % bass).encode('ascii')
             
-            response = requests.post(url, data=xml_body, headers=headers, timeout=self.timeout, verify=False)
-            return response.status_code == 200
+            return self._post_xml('bass', xml_body)
         except Exception:
             return False
 
@@ -531,7 +959,7 @@ class SoundTouchController:
             return False
         
         try:
-            dlna = DLNAHelper(dlna_server_ip=self.ip, device_ip=self.ip, device_dlna_port=self.dlna_port)
+            dlna = self._get_dlna()
             return dlna.set_av_transport_uri(url) and dlna.play()
         except Exception:
             return False
@@ -548,7 +976,7 @@ class SoundTouchController:
             True if successful
         """
         try:
-            dlna = DLNAHelper(dlna_server_ip=dlna_server_ip, device_ip=self.ip, device_dlna_port=self.dlna_port)
+            dlna = self._get_dlna(dlna_server_ip)
             
             # Find first playable track
             res_url, title, protocol_info = dlna.find_first_playable_track(container_id)
@@ -577,7 +1005,7 @@ class SoundTouchController:
     def dlna_stop(self) -> bool:
         """Stop DLNA playback."""
         try:
-            dlna = DLNAHelper(dlna_server_ip=self.ip, device_ip=self.ip, device_dlna_port=self.dlna_port)
+            dlna = self._get_dlna()
             return dlna.stop()
         except Exception:
             return False
@@ -700,25 +1128,28 @@ class SoundTouchController:
             return None
     
     def get_sources(self) -> Optional[List[dict]]:
-        """Get list of available sources."""
+        """Get list of available sources (cached)."""
+        cache_key = (self.ip, self.port, 'sources')
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
         try:
-            url = f"{self.base_url}/sources"
-            response = requests.get(url, timeout=self.timeout, verify=False)
-            
-            if response.status_code == 200:
-                root = ET.fromstring(response.text)
-                sources = []
-                
-                for item in root.findall('sourceItem'):
-                    sources.append({
-                        'source': item.get('source', ''),
-                        'sourceAccount': item.get('sourceAccount', ''),
-                        'status': item.get('status', ''),
-                        'name': item.text or '',
-                    })
-                
-                return sources if sources else None
-            return None
+            root = self._get_xml('sources')
+            if root is None:
+                return None
+            sources = []
+
+            for item in root.iterfind('sourceItem'):
+                sources.append({
+                    'source': item.get('source', ''),
+                    'sourceAccount': item.get('sourceAccount', ''),
+                    'status': item.get('status', ''),
+                    'name': item.text or '',
+                })
+
+            if sources:
+                _response_cache.set(cache_key, sources, ttl=SOURCES_CACHE_TTL)
+            return sources if sources else None
         except Exception:
             return None
     
@@ -736,14 +1167,14 @@ class SoundTouchController:
         try:
             self._set_error('')
             url = f"{self.base_url}/select"
-            headers = {'Content-Type': 'application/xml'}
             # Only include optional attrs when present to avoid device-side validation errors
-            source_account_attr = f' sourceAccount="{source_account}"' if source_account else ''
-            name_attr = f' name="{name}"' if name else ''
-            xml_body = f'<ContentItem source="{source}"{source_account_attr}{name_attr}></ContentItem>'
-            print(f"[DEBUG] select_source request:\nPOST {url}\nBody: {xml_body}\n")
-            response = requests.post(url, data=xml_body, headers=headers, timeout=self.timeout, verify=False)
-            print(f"[DEBUG] select_source response:\n{response.status_code} {response.text}\n")
+            source_account_attr = f' sourceAccount="{escape(source_account)}"' if source_account else ''
+            name_attr = f' name="{escape(name)}"' if name else ''
+            xml_body = f'<ContentItem source="{escape(source)}"{source_account_attr}{name_attr}></ContentItem>'
+            log.debug("select_source request:\nPOST %s\nBody: %s", url, xml_body)
+            response = self.session.post(url, data=xml_body.encode('utf-8'), headers=self._XML_HEADERS, timeout=self.timeout)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("select_source response:\n%s %s", response.status_code, response.text)
             if response.status_code == 200:
                 self._set_error('')
                 return True
@@ -772,39 +1203,37 @@ class SoundTouchController:
         try:
             self._set_error('')
             url = f"{self.base_url}/select"
-            headers = {'Content-Type': 'application/xml'}
             
             # Build ContentItem with location and type
-            # For stationurl and radio sources, include metadata nested inside itemName
-            artist_xml = f'<artist>{escape(artist)}</artist>' if artist else ''
-            album_xml = f'<album>{escape(album)}</album>' if album else ''
-            track_xml = f'<track>{escape(item_name)}</track>' if item_name else ''
-            
-            # Metadata goes INSIDE itemName tag
-            itemName_content = f'{artist_xml}{album_xml}{track_xml}'
-            item_name_xml = f'<itemName>{itemName_content}</itemName>' if itemName_content else ''
-            
-            # Build source account attribute only if not empty
-            source_account_attr = f' sourceAccount="{escape(source_account)}"' if source_account else ''
+            parts = ['<ContentItem source="', escape(source), '"']
             
             # LOCAL_INTERNET_RADIO should NOT have a type attribute
             # type is only for TUNEIN, SPOTIFY, etc.
-            type_attr = '' if source == 'LOCAL_INTERNET_RADIO' else f'type="{escape(item_type)}" '
+            if source != 'LOCAL_INTERNET_RADIO':
+                parts += [' type="', escape(item_type), '"']
+            # Build source account attribute only if not empty
+            if source_account:
+                parts += [' sourceAccount="', escape(source_account), '"']
+            parts += [' location="', escape(location), '">']
             
-            xml_body = (
-                f'<ContentItem source="{escape(source)}" '
-                f'{type_attr}'
-                f'{source_account_attr} '
-                f'location="{escape(location)}">'
-                f'{item_name_xml}'
-                f'</ContentItem>'
-            )
+            # For stationurl and radio sources, include metadata nested inside itemName
+            if artist or album or item_name:
+                parts.append('<itemName>')
+                if artist:
+                    parts += ['<artist>', escape(artist), '</artist>']
+                if album:
+                    parts += ['<album>', escape(album), '</album>']
+                if item_name:
+                    parts += ['<track>', escape(item_name), '</track>']
+                parts.append('</itemName>')
+            
+            parts.append('</ContentItem>')
+            xml_body = ''.join(parts)
             debug_info = f"POST {url}\nBody: {xml_body}"
             
-            response = requests.post(url, data=xml_body, headers=headers, timeout=self.timeout, verify=False)
+            response = self.session.post(url, data=xml_body.encode('utf-8'), headers=self._XML_HEADERS, timeout=self.timeout)
             if response.status_code == 200:
                 # Give the device a moment to process the selection
-                import time
                 time.sleep(1.0)
                 # Send PLAY key twice to ensure playback starts (some devices need this)
                 self.send_key('play')
@@ -839,7 +1268,7 @@ class SoundTouchController:
         try:
             # Try HEAD request first (faster)
             headers = {'Icy-MetaData': '1', 'User-Agent': 'Mozilla/5.0'}
-            response = requests.head(url, headers=headers, timeout=timeout, allow_redirects=True)
+            response = self.session.head(url, headers=headers, timeout=timeout, allow_redirects=True)
             
             # Extract ICY headers
             for key, value in response.headers.items():
@@ -889,11 +1318,9 @@ class SoundTouchController:
                 }
             
             # Build XML for storePreset endpoint
-            import time
             timestamp = int(time.time())
             
             url = f"{self.base_url}/storePreset"
-            headers = {'Content-Type': 'application/xml'}
             
             source = content_item.get('source', '')
             location = content_item.get('location', '')
@@ -916,7 +1343,8 @@ class SoundTouchController:
             
             xml_body += '</ContentItem></Preset>'
             
-            response = requests.put(url, data=xml_body, headers=headers, timeout=self.timeout, verify=False)
+            response = self.session.put(url, data=xml_body.encode('utf-8'), headers=self._XML_HEADERS, timeout=self.timeout)
+            _response_cache.invalidate(self.ip, self.port, 'presets')
             return response.status_code == 200
             
         except Exception as e:
@@ -978,7 +1406,6 @@ class SoundTouchController:
             
             # Build XML
             url = f"{self.base_url}/select"
-            headers = {'Content-Type': 'application/xml'}
             
             xml_body = f'<ContentItem source="{escape(source)}"'
             
@@ -1007,7 +1434,7 @@ class SoundTouchController:
             print(f"URL: {url}")
             print(f"XML: {xml_body}")
             
-            response = requests.post(url, data=xml_body, headers=headers, timeout=self.timeout, verify=False)
+            response = self.session.post(url, data=xml_body.encode('utf-8'), headers=self._XML_HEADERS, timeout=self.timeout)
             
             if response.status_code != 200:
                 # If LOCAL_INTERNET_RADIO fails with UNKNOWN_SOURCE_ERROR, try streaming via DLNA
@@ -1064,18 +1491,19 @@ class SoundTouchController:
         """
         try:
             url = f"{self.base_url}/key"
-            headers = {'Content-Type': 'application/xml'}
+            sender, key = escape(sender), escape(key)
             
-            # Send press
-            press_xml = f'<key state="press" sender="{escape(sender)}">{escape(key)}</key>'
-            response = requests.post(url, data=press_xml, headers=headers, timeout=self.timeout, verify=False)
+            # Send press (press and release must stay in order; both go over the
+            # same keep-alive connection, so the release needs no new handshake)
+            press_xml = (self._KEY_TPL % ('press', sender, key)).encode('utf-8')
+            response = self.session.post(url, data=press_xml, headers=self._XML_HEADERS, timeout=self.timeout)
             if response.status_code != 200:
                 print(f"Key press failed: {response.status_code} - {response.text}")
                 return False
             
             # Send release
-            release_xml = f'<key state="release" sender="{escape(sender)}">{escape(key)}</key>'
-            response = requests.post(url, data=release_xml, headers=headers, timeout=self.timeout, verify=False)
+            release_xml = (self._KEY_TPL % ('release', sender, key)).encode('utf-8')
+            response = self.session.post(url, data=release_xml, headers=self._XML_HEADERS, timeout=self.timeout)
             
             return response.status_code == 200
             
@@ -1124,7 +1552,7 @@ class SoundTouchController:
                 'render': 'json'
             }
             
-            response = requests.get(tunein_api, params=params, timeout=10)
+            response = self.session.get(tunein_api, params=params, timeout=10)
             
             if response.status_code != 200:
                 print(f"TuneIn search failed with status {response.status_code}")
@@ -1214,14 +1642,14 @@ class SoundTouchController:
                 'location': location
             }
             
-            response = requests.get(url, params=params, timeout=self.timeout, verify=False)
+            response = self.session.get(url, params=params, timeout=self.timeout)
             
             if response.status_code != 200:
                 print(f"Browse failed with status {response.status_code}")
                 return []
             
             # Parse XML response
-            root = ET.fromstring(response.text)
+            root = _xml_fromstring(response.content)
             results = []
             
             # Look for <item> or <station> elements
@@ -1261,7 +1689,7 @@ class SoundTouchController:
         """
         try:
             # Follow redirects to get the actual stream URL
-            response = requests.get(tunein_url, allow_redirects=True, timeout=10)
+            response = self.session.get(tunein_url, allow_redirects=True, timeout=10)
             
             # The final URL after redirects is the stream URL
             stream_url = response.url
@@ -1289,9 +1717,9 @@ class SoundTouchController:
         
         try:
             # Check if TUNEIN or LOCAL_INTERNET_RADIO is in active sources
-            response = requests.get(f"http://{self.ip}:{self.port}/sources", timeout=self.timeout)
+            response = self.session.get(f"http://{self.ip}:{self.port}/sources", timeout=self.timeout)
             if response.status_code == 200:
-                root = ET.fromstring(response.content)
+                root = _xml_fromstring(response.content)
                 sources = [s.get('source') for s in root.findall('.//sourceItem')]
                 
                 if 'LOCAL_INTERNET_RADIO' in sources:
@@ -1300,9 +1728,9 @@ class SoundTouchController:
                 
             
             # Check if TUNEIN/LOCAL_INTERNET_RADIO is available in serviceAvailability
-            response = requests.get(f"http://{self.ip}:{self.port}/serviceAvailability", timeout=self.timeout)
+            response = self.session.get(f"http://{self.ip}:{self.port}/serviceAvailability", timeout=self.timeout)
             if response.status_code == 200:
-                root = ET.fromstring(response.content)
+                root = _xml_fromstring(response.content)
                 for service in root.findall('.//service'):
                     stype = service.get('type')
                     if stype == 'LOCAL_INTERNET_RADIO' and service.get('isAvailable') == 'true':
@@ -1354,7 +1782,7 @@ class SoundTouchController:
         <itemName>BBC Radio 1</itemName>
     </ContentItem>
 </preset>'''
-            response = requests.put(
+            response = self.session.put(
                 f"http://{self.ip}:{self.port}/storePreset",
                 headers={'Content-Type': 'application/xml'},
                 data=preset_xml,
@@ -1363,9 +1791,10 @@ class SoundTouchController:
             print(f"  Preset store response: {response.status_code}")
         except Exception as e:
             print(f"  Preset store failed: {e}")
+        # Also after a timeout: the device may have stored the preset anyway
+        _response_cache.invalidate(self.ip, self.port, 'presets')
         
         # Check if it worked
-        import time
         time.sleep(1)
         status_after = self.check_tunein_available()
         if status_after['in_sources']:
@@ -1380,7 +1809,7 @@ class SoundTouchController:
              sourceAccount="" isPresetable="true">
     <itemName>BBC Radio 1</itemName>
 </ContentItem>'''
-            response = requests.post(
+            response = self.session.post(
                 f"http://{self.ip}:{self.port}/select",
                 headers={'Content-Type': 'application/xml'},
                 data=select_xml,
@@ -1403,7 +1832,7 @@ class SoundTouchController:
             for state in ['press', 'release']:
                 key_xml = f'''<?xml version="1.0" encoding="UTF-8"?>
 <key state="{state}" sender="Gabbo">PRESET_1</key>'''
-                requests.post(
+                self.session.post(
                     f"http://{self.ip}:{self.port}/key",
                     headers={'Content-Type': 'application/xml'},
                     data=key_xml,
@@ -1469,13 +1898,10 @@ class SoundTouchController:
         if url.startswith("https://") and proxy_https:
             try:
                 from https_proxy import get_proxy_instance
-                import socket
                 
-                # Get local IP
-                s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                s.connect(("8.8.8.8", 80))
-                local_ip = s.getsockname()[0]
-                s.close()
+                local_ip = get_local_ip()
+                if not local_ip:
+                    raise OSError("no local IP address available")
                 
                 # Start proxy if not running
                 proxy = get_proxy_instance()
@@ -1504,9 +1930,7 @@ class SoundTouchController:
         try:
             # Detect MIME type from URL extension or parameters
             # Note: For YouTube, the proxy will convert MP4→MP3, so we always use audio/mpeg
-            mime = "audio/mpeg"
             lowered_original = original_url.lower()
-            lowered = url.lower()
             
             # Check original URL for YouTube/Google Video
             # The HTTPS proxy now converts MP4 → MP3 on-the-fly for YouTube
@@ -1516,16 +1940,8 @@ class SoundTouchController:
                 # YouTube streams are converted to MP3 by the proxy
                 mime = "audio/mpeg"
                 print(f"🎬 YouTube detected - proxy will convert MP4 → MP3")
-            elif lowered.endswith(".flac"):
-                mime = "audio/flac"
-            elif lowered.endswith(".wav"):
-                mime = "audio/wav"
-            elif lowered.endswith(".m4a") or lowered.endswith(".mp4"):
-                mime = "audio/mp4"
-            elif lowered.endswith(".aac"):
-                mime = "audio/aac"
-            elif lowered.endswith(".ogg") or lowered.endswith(".oga"):
-                mime = "audio/ogg"
+            else:
+                mime = _EXT_MIME.get(url.rsplit('.', 1)[-1].lower(), "audio/mpeg")
             
             # Build protocol info with DLNA extensions
             dlna_flags = "DLNA.ORG_OP=01;DLNA.ORG_CI=0;DLNA.ORG_FLAGS=01500000000000000000000000000000"
@@ -1542,7 +1958,7 @@ class SoundTouchController:
                 protocol_info = f"http-get:*:{mime}:{dlna_flags}"
             
             # Use DLNAHelper to send SOAP commands
-            dlna = DLNAHelper(dlna_server_ip=self.ip, device_ip=self.ip, device_dlna_port=self.dlna_port)
+            dlna = self._get_dlna()
             
             # Set URI with metadata
             if not dlna.set_av_transport_uri(url, title=track, protocol_info=protocol_info,
@@ -1660,7 +2076,6 @@ class SoundTouchController:
         import threading
         
         def update_loop():
-            import time
             while True:
                 time.sleep(10)  # Update every 10 seconds
                 
@@ -1679,68 +2094,75 @@ class SoundTouchController:
         self._metadata_thread.start()
         print("🔄 Started metadata updater thread")
     
-    def get_presets(self) -> Optional[List[dict]]:
-        """Get list of presets."""
+    def get_presets(self, force_refresh: bool = False) -> Optional[List[dict]]:
+        """Get list of presets (cached briefly, refreshed after store_preset).
+        Pass force_refresh=True for an explicit user refresh: presets stored
+        with the device buttons don't invalidate the cache.
+        """
+        cache_key = (self.ip, self.port, 'presets')
+        if not force_refresh:
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                return cached
         try:
-            url = f"{self.base_url}/presets"
-            response = requests.get(url, timeout=self.timeout, verify=False)
-            
-            if response.status_code == 200:
-                root = ET.fromstring(response.text)
-                presets = []
-                
-                for preset in root.findall('preset'):
-                    preset_id = preset.get('id', '')
-                    item = preset.find('ContentItem')
-                    if item is not None:
-                        presets.append({
-                            'id': preset_id,
-                            'source': item.get('source', ''),
-                            'sourceAccount': item.get('sourceAccount', ''),
-                            'itemName': item.findtext('itemName', ''),
-                        })
-                
-                return presets if presets else None
-            return None
+            root = self._get_xml('presets')
+            if root is None:
+                return None
+            presets = []
+
+            for preset in root.iterfind('preset'):
+                preset_id = preset.get('id', '')
+                item = preset.find('ContentItem')
+                if item is not None:
+                    presets.append({
+                        'id': preset_id,
+                        'source': item.get('source', ''),
+                        'sourceAccount': item.get('sourceAccount', ''),
+                        'itemName': item.findtext('itemName', ''),
+                    })
+
+            if presets:
+                _response_cache.set(cache_key, presets, ttl=PRESETS_CACHE_TTL)
+            return presets if presets else None
         except Exception:
             return None
     
     def get_capabilities(self) -> Optional[List[dict]]:
-        """Get device capabilities."""
+        """Get device capabilities (cached)."""
+        cache_key = (self.ip, self.port, 'capabilities')
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
         try:
-            url = f"{self.base_url}/capabilities"
-            response = requests.get(url, timeout=self.timeout, verify=False)
-            
-            if response.status_code == 200:
-                root = ET.fromstring(response.text)
-                capabilities = []
-                
-                for cap in root.findall('capability'):
-                    capabilities.append({
-                        'name': cap.get('name', ''),
-                        'url': cap.get('url', ''),
-                        'info': cap.get('info', ''),
-                    })
-                
-                return capabilities if capabilities else None
-            return None
+            root = self._get_xml('capabilities')
+            if root is None:
+                return None
+            capabilities = []
+
+            for cap in root.iterfind('capability'):
+                capabilities.append({
+                    'name': cap.get('name', ''),
+                    'url': cap.get('url', ''),
+                    'info': cap.get('info', ''),
+                })
+
+            if capabilities:
+                _response_cache.set(cache_key, capabilities)
+            return capabilities if capabilities else None
         except Exception:
             return None
     
     def get_audio_dsp_controls(self) -> Optional[dict]:
         """Get audio DSP settings (audio mode, video sync delay, etc.)."""
         try:
-            url = f"{self.base_url}/audiodspcontrols"
-            response = requests.get(url, timeout=self.timeout, verify=False)
-            
-            if response.status_code == 200:
-                root = ET.fromstring(response.text)
-                return {
-                    'audiomode': root.get('audiomode', ''),
-                    'videosyncaudiodelay': int(root.get('videosyncaudiodelay', '0')),
-                    'supportedaudiomodes': root.get('supportedaudiomodes', '').split('|'),
-                }
-            return None
+            root = self._get_xml('audiodspcontrols')
+            if root is None:
+                return None
+            return {
+                'audiomode': root.get('audiomode', ''),
+                'videosyncaudiodelay': int(root.get('videosyncaudiodelay', '0')),
+                'supportedaudiomodes': root.get('supportedaudiomodes', '').split('|'),
+            }
         except Exception:
             return None
     
@@ -1756,50 +2178,50 @@ class SoundTouchController:
             True if successful
         """
         try:
-            url = f"{self.base_url}/audiodspcontrols"
-            headers = {'Content-Type': 'application/xml'}
-            
-            attrs = []
-            if audiomode:
-                attrs.append(f'audiomode="{audiomode}"')
-            if videosyncaudiodelay is not None:
-                attrs.append(f'videosyncaudiodelay="{videosyncaudiodelay}"')
-            
-            attrs_str = ' '.join(attrs)
+            values = {
+                'audiomode': audiomode or None,
+                'videosyncaudiodelay': videosyncaudiodelay,
+            }
+            attrs_str = ' '.join(
+                f'{attr}="{escape(str(value))}"' for attr, value in values.items() if value is not None
+            )
             xml_body = f'<audiodspcontrols {attrs_str} />'
             
-            response = requests.post(url, data=xml_body, headers=headers, timeout=self.timeout, verify=False)
-            return response.status_code == 200
+            return self._post_xml('audiodspcontrols', xml_body)
         except Exception:
             return False
     
+    @staticmethod
+    def _parse_range(elem) -> dict:
+        """Read value/minValue/maxValue/step of a tone or level element (defaults if missing)."""
+        if elem is None:
+            return {'value': 0, 'minValue': 0, 'maxValue': 0, 'step': 1}
+        get = elem.get
+        return {
+            'value': int(get('value', '0')),
+            'minValue': int(get('minValue', '0')),
+            'maxValue': int(get('maxValue', '0')),
+            'step': int(get('step', '1')),
+        }
+
     def get_tone_controls(self) -> Optional[dict]:
-        """Get bass and treble settings."""
+        """Get bass and treble settings (cached for SETTINGS_CACHE_TTL)."""
+        cache_key = (self.ip, self.port, 'audioproducttonecontrols')
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
         try:
-            url = f"{self.base_url}/audioproducttonecontrols"
-            response = requests.get(url, timeout=self.timeout, verify=False)
-            
-            if response.status_code == 200:
-                root = ET.fromstring(response.text)
-                bass_elem = root.find('bass')
-                treble_elem = root.find('treble')
-                
-                return {
-                    'bass': {
-                        'value': int(bass_elem.get('value', '0')) if bass_elem is not None else 0,
-                        'minValue': int(bass_elem.get('minValue', '0')) if bass_elem is not None else 0,
-                        'maxValue': int(bass_elem.get('maxValue', '0')) if bass_elem is not None else 0,
-                        'step': int(bass_elem.get('step', '1')) if bass_elem is not None else 1,
-                    },
-                    'treble': {
-                        'value': int(treble_elem.get('value', '0')) if treble_elem is not None else 0,
-                        'minValue': int(treble_elem.get('minValue', '0')) if treble_elem is not None else 0,
-                        'maxValue': int(treble_elem.get('maxValue', '0')) if treble_elem is not None else 0,
-                        'step': int(treble_elem.get('step', '1')) if treble_elem is not None else 1,
-                    },
-                }
-            return None
-        except Exception:
+            root = self._get_xml('audioproducttonecontrols')
+            if root is None:
+                return None
+            parse_range = self._parse_range
+            tone = {
+                'bass': parse_range(root.find('bass')),
+                'treble': parse_range(root.find('treble')),
+            }
+            _response_cache.set(cache_key, tone, ttl=SETTINGS_CACHE_TTL)
+            return tone
+        except _DEVICE_ERRORS:
             return None
     
     def set_tone_controls(self, bass: int = None, treble: int = None) -> bool:
@@ -1814,49 +2236,40 @@ class SoundTouchController:
             True if successful
         """
         try:
-            url = f"{self.base_url}/audioproducttonecontrols"
-            headers = {'Content-Type': 'application/xml'}
-            
-            parts = []
-            if bass is not None:
-                parts.append(f'<bass value="{bass}" />')
-            if treble is not None:
-                parts.append(f'<treble value="{treble}" />')
-            
-            xml_body = f'<audioproducttonecontrols>{"".join(parts)}</audioproducttonecontrols>'
+            tpl = self._VALUE_TPL
+            xml_body = (
+                '<audioproducttonecontrols>'
+                + (tpl % ('bass', bass) if bass is not None else '')
+                + (tpl % ('treble', treble) if treble is not None else '')
+                + '</audioproducttonecontrols>'
+            )
             
-            response = requests.post(url, data=xml_body, headers=headers, timeout=self.timeout, verify=False)
-            return response.status_code == 200
-        except Exception:
+            try:
+                return self._post_xml('audioproducttonecontrols', xml_body)
+            finally:
+                # After the write, so a read racing with the POST can't re-cache the old value
+                _response_cache.invalidate(self.ip, self.port, 'audioproducttonecontrols')
+        except _DEVICE_ERRORS:
             return False
     
     def get_level_controls(self) -> Optional[dict]:
-        """Get front-center and rear-surround speaker levels."""
+        """Get front-center and rear-surround speaker levels (cached for SETTINGS_CACHE_TTL)."""
+        cache_key = (self.ip, self.port, 'audioproductlevelcontrols')
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
         try:
-            url = f"{self.base_url}/audioproductlevelcontrols"
-            response = requests.get(url, timeout=self.timeout, verify=False)
-            
-            if response.status_code == 200:
-                root = ET.fromstring(response.text)
-                front_elem = root.find('frontCenterSpeakerLevel')
-                rear_elem = root.find('rearSurroundSpeakersLevel')
-                
-                return {
-                    'frontCenterSpeakerLevel': {
-                        'value': int(front_elem.get('value', '0')) if front_elem is not None else 0,
-                        'minValue': int(front_elem.get('minValue', '0')) if front_elem is not None else 0,
-                        'maxValue': int(front_elem.get('maxValue', '0')) if front_elem is not None else 0,
-                        'step': int(front_elem.get('step', '1')) if front_elem is not None else 1,
-                    },
-                    'rearSurroundSpeakersLevel': {
-                        'value': int(rear_elem.get('value', '0')) if rear_elem is not None else 0,
-                        'minValue': int(rear_elem.get('minValue', '0')) if rear_elem is not None else 0,
-                        'maxValue': int(rear_elem.get('maxValue', '0')) if rear_elem is not None else 0,
-                        'step': int(rear_elem.get('step', '1')) if rear_elem is not None else 1,
-                    },
-                }
-            return None
-        except Exception:
+            root = self._get_xml('audioproductlevelcontrols')
+            if root is None:
+                return None
+            parse_range = self._parse_range
+            levels = {
+                'frontCenterSpeakerLevel': parse_range(root.find('frontCenterSpeakerLevel')),
+                'rearSurroundSpeakersLevel': parse_range(root.find('rearSurroundSpeakersLevel')),
+            }
+            _response_cache.set(cache_key, levels, ttl=SETTINGS_CACHE_TTL)
+            return levels
+        except _DEVICE_ERRORS:
             return None
     
     def set_level_controls(self, front: int = None, rear: int = None) -> bool:
@@ -1871,44 +2284,46 @@ class SoundTouchController:
             True if successful
         """
         try:
-            url = f"{self.base_url}/audioproductlevelcontrols"
-            headers = {'Content-Type': 'application/xml'}
-            
-            parts = []
-            if front is not None:
-                parts.append(f'<frontCenterSpeakerLevel value="{front}" />')
-            if rear is not None:
-                parts.append(f'<rearSurroundSpeakersLevel value="{rear}" />')
-            
-            xml_body = f'<audioproductlevelcontrols>{"".join(parts)}</audioproductlevelcontrols>'
+            tpl = self._VALUE_TPL
+            xml_body = (
+                '<audioproductlevelcontrols>'
+                + (tpl % ('frontCenterSpeakerLevel', front) if front is not None else '')
+                + (tpl % ('rearSurroundSpeakersLevel', rear) if rear is not None else '')
+                + '</audioproductlevelcontrols>'
+            )
             
-            response = requests.post(url, data=xml_body, headers=headers, timeout=self.timeout, verify=False)
-            return response.status_code == 200
-        except Exception:
+            try:
+                return self._post_xml('audioproductlevelcontrols', xml_body)
+            finally:
+                _response_cache.invalidate(self.ip, self.port, 'audioproductlevelcontrols')
+        except _DEVICE_ERRORS:
             return False
     
     def get_zone(self) -> Optional[dict]:
-        """Get current multi-room zone configuration."""
+        """Get current multi-room zone configuration (cached for SETTINGS_CACHE_TTL)."""
+        cache_key = (self.ip, self.port, 'getZone')
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
         try:
-            url = f"{self.base_url}/getZone"
-            response = requests.get(url, timeout=self.timeout, verify=False)
-            
-            if response.status_code == 200:
-                root = ET.fromstring(response.text)
-                members = []
-                
-                for member in root.findall('member'):
-                    members.append({
-                        'ipaddress': member.get('ipaddress', ''),
-                        'macaddr': member.text or '',
-                    })
-                
-                return {
-                    'master': root.get('master', ''),
-                    'members': members,
-                }
-            return None
-        except Exception:
+            root = self._get_xml('getZone')
+            if root is None:
+                return None
+            members = []
+
+            for member in root.iterfind('member'):
+                members.append({
+                    'ipaddress': member.get('ipaddress', ''),
+                    'macaddr': member.text or '',
+                })
+
+            zone = {
+                'master': root.get('master', ''),
+                'members': members,
+            }
+            _response_cache.set(cache_key, zone, ttl=SETTINGS_CACHE_TTL)
+            return zone
+        except _DEVICE_ERRORS:
             return None
     
     def set_zone(self, master_mac: str, members: List[tuple]) -> bool:
@@ -1923,25 +2338,24 @@ class SoundTouchController:
             True if successful
         """
         try:
-            url = f"{self.base_url}/setZone"
-            headers = {'Content-Type': 'application/xml'}
-
             # Laut Bose-API muss der Master selbst als erster <member> enthalten
             # sein. members enthält i.d.R. nur die Slaves -> Master voranstellen
             # (und Duplikate vermeiden).
+            master_upper = master_mac.upper()
             all_members = [(self.ip, master_mac)]
             for ip, mac in members:
-                if mac and mac.upper() != master_mac.upper():
+                if mac and mac.upper() != master_upper:
                     all_members.append((ip, mac))
 
-            members_xml = ''.join(
-                f'<member ipaddress="{ip}">{mac}</member>' for ip, mac in all_members
-            )
-            xml_body = f'<zone master="{master_mac}" senderIPAddress="{self.ip}">{members_xml}</zone>'
+            tpl = self._MEMBER_TPL
+            members_xml = ''.join(tpl % (escape(ip), escape(mac)) for ip, mac in all_members)
+            xml_body = f'<zone master="{escape(master_mac)}" senderIPAddress="{escape(self.ip)}">{members_xml}</zone>'
 
-            response = requests.post(url, data=xml_body, headers=headers, timeout=self.timeout, verify=False)
-            return response.status_code == 200
-        except Exception:
+            try:
+                return self._post_xml('setZone', xml_body)
+            finally:
+                _response_cache.invalidate_endpoint('getZone')
+        except _DEVICE_ERRORS:
             return False
     
     def add_zone_slave(self, master_mac: str, slave_ip: str, slave_mac: str) -> bool:
@@ -1956,14 +2370,31 @@ class SoundTouchController:
         Returns:
             True if successful
         """
+        return self.add_zone_slaves(master_mac, [(slave_ip, slave_mac)])
+    
+    def add_zone_slaves(self, master_mac: str, members: List[tuple]) -> bool:
+        """
+        Add several slave devices to a zone with a single request.
+        
+        Args:
+            master_mac: MAC address of master device
+            members: List of (ip, mac) tuples for the slaves to add
+            
+        Returns:
+            True if successful
+        """
+        if not members:
+            return True
         try:
-            url = f"{self.base_url}/addZoneSlave"
-            headers = {'Content-Type': 'application/xml'}
-            xml_body = f'<zone master="{master_mac}"><member ipaddress="{slave_ip}">{slave_mac}</member></zone>'
+            tpl = self._MEMBER_TPL
+            members_xml = ''.join(tpl % (escape(ip), escape(mac)) for ip, mac in members)
+            xml_body = f'<zone master="{escape(master_mac)}">{members_xml}</zone>'
             
-            response = requests.post(url, data=xml_body, headers=headers, timeout=self.timeout, verify=False)
-            return response.status_code == 200
-        except Exception:
+            try:
+                return self._post_xml('addZoneSlave', xml_body)
+            finally:
+                _response_cache.invalidate_endpoint('getZone')
+        except _DEVICE_ERRORS:
             return False
     
     def remove_zone_slave(self, master_mac: str, slave_mac: str) -> bool:
@@ -1977,14 +2408,30 @@ class SoundTouchController:
         Returns:
             True if successful
         """
+        return self.remove_zone_slaves(master_mac, [slave_mac])
+    
+    def remove_zone_slaves(self, master_mac: str, slave_macs: List[str]) -> bool:
+        """
+        Remove several slave devices from a zone with a single request.
+        
+        Args:
+            master_mac: MAC address of master device
+            slave_macs: MAC addresses of the slaves to remove
+            
+        Returns:
+            True if successful
+        """
+        if not slave_macs:
+            return True
         try:
-            url = f"{self.base_url}/removeZoneSlave"
-            headers = {'Content-Type': 'application/xml'}
-            xml_body = f'<zone master="{master_mac}"><member>{slave_mac}</member></zone>'
+            members_xml = ''.join(f'<member>{escape(mac)}</member>' for mac in slave_macs)
+            xml_body = f'<zone master="{escape(master_mac)}">{members_xml}</zone>'
             
-            response = requests.post(url, data=xml_body, headers=headers, timeout=self.timeout, verify=False)
-            return response.status_code == 200
-        except Exception:
+            try:
+                return self._post_xml('removeZoneSlave', xml_body)
+            finally:
+                _response_cache.invalidate_endpoint('getZone')
+        except _DEVICE_ERRORS:
             return False
     
     def set_device_name(self, name: str) -> bool:
@@ -1998,13 +2445,13 @@ class SoundTouchController:
             True if successful
         """
         try:
-            url = f"{self.base_url}/name"
-            headers = {'Content-Type': 'application/xml'}
             xml_body = f'<name>{escape(name)}</name>'
 
-            response = requests.post(url, data=xml_body, headers=headers, timeout=self.timeout, verify=False)
-            return response.status_code == 200
-        except Exception:
+            try:
+                return self._post_xml('name', xml_body)
+            finally:
+                _response_cache.invalidate(self.ip, self.port, 'info')
+        except _DEVICE_ERRORS:
             return False
 
     def set_setup_state(self, state: str, timeout_ms: Optional[int] = None) -> bool:
@@ -2015,11 +2462,8 @@ class SoundTouchController:
                 attrs.append(f'timeout="{timeout_ms}"')
             xml_body = f"<setupState {' '.join(attrs)} />"
 
-            url = f"{self.base_url}/setup"
-            headers = {'Content-Type': 'application/xml'}
-            response = requests.post(url, data=xml_body, headers=headers, timeout=self.timeout, verify=False)
-            return response.status_code == 200
-        except Exception:
+            return self._post_xml('setup', xml_body)
+        except _DEVICE_ERRORS:
             return False
 
     def add_wireless_profile(self, ssid: str, password: str, security_type: str = "wpa_or_wpa2", timeout_secs: int = 30, monitor_callback=None) -> bool:
@@ -2037,7 +2481,6 @@ class SoundTouchController:
         Returns:
             True if WiFi config was sent and device entered reboot sequence
         """
-        import time
         
         config_sent = False
         try:
@@ -2058,16 +2501,9 @@ class SoundTouchController:
 
             # Do not force SETUP_WIFI here; device is already in setup when connected to its hotspot.
 
-            # Build XML using ElementTree for proper escaping
-            root = ET.Element('AddWirelessProfile')
-            root.set('timeout', str(timeout_secs))
-            profile = ET.SubElement(root, 'profile')
-            profile.set('ssid', ssid)
-            profile.set('password', password)
-            profile.set('securityType', security_value)
-            
-            # Convert to string
-            xml_body = ET.tostring(root, encoding='unicode')
+            xml_body = self._WIFI_PROFILE_TPL % (
+                timeout_secs, escape(ssid), escape(password or ''), escape(security_value)
+            )
 
             # Debug summary without exposing password
             if monitor_callback:
@@ -2075,13 +2511,16 @@ class SoundTouchController:
                 monitor_callback(f"XML: <AddWirelessProfile timeout=\"{timeout_secs}\"><profile ssid=\"{ssid}\" password=\"{masked_pw}\" securityType=\"{security_value}\"/></AddWirelessProfile>")
 
             url = f"{self.base_url}/addWirelessProfile"
-            headers = {'Content-Type': 'application/xml'}
             
             # Mark config as sent before POST (important for timeout handling)
             config_sent = True
             
             try:
-                response = requests.post(url, data=xml_body, headers=headers, timeout=self.timeout, verify=False)
+                try:
+                    response = self.session.post(url, data=xml_body.encode('utf-8'), headers=self._XML_HEADERS,
+                                                 timeout=self.timeout)
+                finally:
+                    _response_cache.invalidate(self.ip, self.port, 'getActiveWirelessProfile')
                 
                 # Accept any 2xx status code (200, 201, 204, etc.)
                 if not (200 <= response.status_code < 300):
@@ -2125,16 +2564,17 @@ class SoundTouchController:
         Args:
             target_ssid: The SSID the device should connect to
             max_wait_seconds: Maximum time to wait for reconnection (default: 120 seconds)
-            check_interval: Interval between status checks in seconds (default: 5 seconds)
+            check_interval: Maximum interval between status checks in seconds (default: 5 seconds);
+                checks start 1 s apart and back off up to this value
             status_callback: Optional callback function(status_message) for progress updates
             
         Returns:
             True if device successfully reconnected to target network, False on timeout or error
         """
-        import time
         
         start_time = time.time()
         attempt = 0
+        delay = 1.0
         
         while time.time() - start_time < max_wait_seconds:
             attempt += 1
@@ -2145,28 +2585,21 @@ class SoundTouchController:
             
             try:
                 # Try to get device info to see if it's reachable
-                response = requests.get(
+                response = self.session.get(
                     f"{self.base_url}/info",
-                    timeout=3,
-                    verify=False
+                    timeout=3
                 )
                 
                 if response.status_code == 200:
-                    # Device is reachable, check network status
-                    try:
-                        info = response.json() if response.headers.get('content-type') == 'application/json' else ET.fromstring(response.text)
-                        
-                        if status_callback:
-                            status_callback(f"✅ Device is reachable! Verifying network connection...")
-                        
-                        # Device is back online - check if it's on the right network
-                        # Device should be back on home network after reconnection
-                        return True
-                        
-                    except Exception as parse_error:
-                        if status_callback:
-                            status_callback(f"Device reachable but couldn't parse response, assuming reconnection successful")
-                        return True
+                    # Device is reachable again; the body itself isn't needed
+                    if status_callback:
+                        status_callback(f"✅ Device is reachable! Verifying network connection...")
+                    
+                    # Rebooted device: don't serve pre-reboot capabilities/sources
+                    self.clear_cache()
+                    
+                    # Device should be back on home network after reconnection
+                    return True
                         
             except requests.exceptions.ConnectionError:
                 if status_callback:
@@ -2178,8 +2611,9 @@ class SoundTouchController:
                 if status_callback:
                     status_callback(f"Checking... ({elapsed}s elapsed)")
             
-            # Wait before next check
-            time.sleep(check_interval)
+            # Wait before next check: poll quickly at first, then back off
+            time.sleep(min(delay, check_interval))
+            delay *= 1.5
         
         # Timeout reached
         if status_callback:
@@ -2187,103 +2621,117 @@ class SoundTouchController:
         return False
 
     def get_wireless_profile(self) -> Optional[dict]:
-        """Return the active wireless profile (SSID)."""
+        """Return the active wireless profile (SSID), cached for SETTINGS_CACHE_TTL."""
+        cache_key = (self.ip, self.port, 'getActiveWirelessProfile')
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
         try:
             url = f"{self.base_url}/getActiveWirelessProfile"
-            response = requests.get(url, timeout=self.timeout, verify=False)
+            response = self.session.get(url, timeout=self.timeout)
 
             if response.status_code != 200:
                 return None
 
-            root = ET.fromstring(response.text)
-            ssid = root.findtext('ssid', '')
-            if not ssid:
-                ssid = root.get('ssid', '')
+            root = _xml_fromstring(response.content)
+            ssid = root.findtext('ssid') or root.get('ssid', '')
 
-            return {
+            profile = {
                 'ssid': ssid,
                 'raw': response.text
             }
-        except Exception:
+            _response_cache.set(cache_key, profile, ttl=SETTINGS_CACHE_TTL)
+            return profile
+        except _DEVICE_ERRORS:
             return None
 
     def perform_wireless_site_survey(self) -> Optional[dict]:
         """Scan for visible WiFi networks and return parsed results when possible."""
         try:
             url = f"{self.base_url}/performWirelessSiteSurvey"
-            response = requests.get(url, timeout=self.timeout, verify=False)
+            response = self.session.get(url, timeout=self.timeout)
 
             if response.status_code != 200:
-                print(f"[DEBUG] Site survey returned status {response.status_code}")
+                log.debug("Site survey returned status %s", response.status_code)
                 return None
 
             raw = response.text
-            # Debug: print the raw response
-            print(f"[DEBUG] Site survey raw response:\n{raw}\n")
+            log.debug("Site survey raw response:\n%s", raw)
             
-            root = ET.fromstring(raw)
-            print(f"[DEBUG] Root tag: {root.tag}")
+            root = _xml_fromstring(response.content)
             
             networks: list[dict] = []
 
-            # Preferred format (as seen in device response): items/item elements
-            items = root.findall('.//items/item')
-            if not items:
-                # Some devices might not nest under <items>
-                items = root.findall('.//item')
+            # Collect all candidate elements in a single walk over the tree
+            # instead of one full './/' search per supported format.
+            nested_items, loose_items, wireless_networks = [], [], []
+            for parent in root.iter():
+                for child in parent:
+                    if child.tag == 'item':
+                        if parent.tag == 'items':
+                            nested_items.append(child)
+                        else:
+                            loose_items.append(child)
+                    elif child.tag == 'wirelessNetwork':
+                        wireless_networks.append(child)
+
+            # Preferred format (as seen in device response): items/item elements.
+            # Some devices might not nest under <items>.
+            items = nested_items or loose_items
 
             for item in items:
-                ssid = item.get('ssid') or item.findtext('ssid', '')
-                signal = item.get('signalStrength') or item.findtext('signalStrength', '')
-                secure_attr = item.get('secure')
+                get, findtext = item.get, item.findtext
+                ssid = get('ssid') or findtext('ssid', '')
+                if not ssid:
+                    continue
+                signal = get('signalStrength') or findtext('signalStrength', '')
+                secure_attr = get('secure')
                 secure = None
                 if secure_attr is not None:
                     secure = str(secure_attr).lower() == 'true'
 
-                # Collect security types (first one is typically the effective one)
-                sec_types = [t.text.strip() for t in item.findall('.//securityTypes/type') if t is not None and t.text]
-                security = sec_types[0] if sec_types else (item.get('securityType') or item.findtext('securityType', ''))
+                # First listed security type is typically the effective one
+                security = next(
+                    (t.text.strip() for t in item.iterfind('.//securityTypes/type') if t.text),
+                    None
+                )
+                if security is None:
+                    security = get('securityType') or findtext('securityType', '')
 
-                if ssid:
-                    networks.append({
-                        'ssid': ssid,
-                        'signal': signal,
-                        'security': security,
-                        'secure': secure,
-                    })
+                networks.append({
+                    'ssid': ssid,
+                    'signal': signal,
+                    'security': security,
+                    'secure': secure,
+                })
 
             # Fallback format used in some docs: <wirelessNetwork>
             if not networks:
-                for nw in root.findall('.//wirelessNetwork'):
-                    ssid = nw.get('ssid') or nw.findtext('ssid', '')
-                    signal = nw.get('signalStrength') or nw.findtext('signalStrength', '')
-                    security = nw.get('securityType') or nw.findtext('securityType', '')
+                for nw in wireless_networks:
+                    get, findtext = nw.get, nw.findtext
+                    ssid = get('ssid') or findtext('ssid', '')
+                    signal = get('signalStrength') or findtext('signalStrength', '')
+                    security = get('securityType') or findtext('securityType', '')
                     if ssid:
                         networks.append({'ssid': ssid, 'signal': signal, 'security': security})
 
-            print(f"[DEBUG] Total networks found: {len(networks)}")
-            if networks:
-                print(f"[DEBUG] Networks: {networks}")
+            log.debug("Site survey found %d networks: %s", len(networks), networks)
             
             return {
                 'networks': networks,
                 'raw': raw
             }
-        except ET.ParseError as e:
-            print(f"[DEBUG] XML Parse error: {e}")
-            import traceback
-            traceback.print_exc()
+        except _XML_PARSE_ERRORS as e:
+            log.debug("Site survey XML parse error: %s", e)
             return None
-        except Exception as e:
-            print(f"[DEBUG] Site survey exception: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            log.exception("Site survey failed")
             return None
     
     @staticmethod
     def get_available_keys() -> List[str]:
         """Get list of available keys."""
-        return sorted(SoundTouchController.KEYS.keys())
+        return list(SoundTouchController._AVAILABLE_KEYS)
 
 
 class SoundTouchGroupManager:
@@ -2298,6 +2746,14 @@ class SoundTouchGroupManager:
         """
         self.devices = devices
         self.groups = []
+        self._controllers = {}  # ip -> SoundTouchController, reused across group operations
+    
+    def _controller(self, ip: str) -> SoundTouchController:
+        """Return the controller for a device IP, creating it on first use."""
+        controller = self._controllers.get(ip)
+        if controller is None:
+            controller = self._controllers.setdefault(ip, SoundTouchController(ip))
+        return controller
     
     def load_groups_from_devices(self) -> bool:
         """
@@ -2312,11 +2768,18 @@ class SoundTouchGroupManager:
             self.groups = []
             found_zones = set()  # Track which master MACs we've already processed
             
-            for device in self.devices:
+            def fetch_zone(device):
+                try:
+                    return self._controller(device['ip']).get_zone()
+                except Exception as e:
+                    print(f"Error reading zone from {device.get('name')}: {e}")
+                    return None
+            
+            # Zonen aller Geräte gleichzeitig abfragen statt nacheinander
+            zones = _map_concurrently(fetch_zone, self.devices)
+            
+            for device, zone_info in zip(self.devices, zones):
                 try:
-                    controller = SoundTouchController(device['ip'])
-                    zone_info = controller.get_zone()
-                    
                     # Check if zone has a valid master (non-empty string)
                     if zone_info and zone_info.get('master') and zone_info.get('master').strip():
                         master_mac = zone_info['master']
@@ -2355,7 +2818,6 @@ class SoundTouchGroupManager:
                                 'name': f"Gruppe {master_device['name']}",
                                 'master': master_device,
                                 'slaves': slave_devices,
-                                'all_devices': [master_device] + slave_devices
                             }
                             self.groups.append(group)
                             print(f"DEBUG: Gruppe geladen: {group['name']} mit {len(slave_devices)} Slaves")
@@ -2385,7 +2847,7 @@ class SoundTouchGroupManager:
             True if successful
         """
         try:
-            master_controller = SoundTouchController(master_device['ip'])
+            master_controller = self._controller(master_device['ip'])
             master_mac = master_device['mac']
             
             # Prepare members list
@@ -2399,7 +2861,6 @@ class SoundTouchGroupManager:
                     'name': group_name or f"Group {master_device['name']}",
                     'master': master_device,
                     'slaves': slave_devices,
-                    'all_devices': [master_device] + slave_devices
                 }
                 self.groups.append(group)
                 
@@ -2426,12 +2887,11 @@ class SoundTouchGroupManager:
             group = self.groups[group_index]
             master = group['master']
             
-            controller = SoundTouchController(master['ip'])
+            controller = self._controller(master['ip'])
             success = controller.add_zone_slave(master['mac'], device['ip'], device['mac'])
             
             if success:
                 group['slaves'].append(device)
-                group['all_devices'].append(device)
                 
             return success
         except Exception as e:
@@ -2456,12 +2916,41 @@ class SoundTouchGroupManager:
             group = self.groups[group_index]
             master = group['master']
             
-            controller = SoundTouchController(master['ip'])
+            controller = self._controller(master['ip'])
             success = controller.remove_zone_slave(master['mac'], device['mac'])
             
             if success:
                 group['slaves'] = [d for d in group['slaves'] if d['mac'] != device['mac']]
-                group['all_devices'] = [master] + group['slaves']
+                
+            return success
+        except Exception as e:
+            print(f"Error removing from group: {e}")
+            return False
+    
+    def remove_slaves_from_group(self, group_index: int, devices: List[dict]) -> bool:
+        """
+        Remove several devices from a group with a single request to the master.
+        
+        Args:
+            group_index: Index of group in self.groups
+            devices: Device dicts to remove
+            
+        Returns:
+            True if successful
+        """
+        try:
+            if group_index >= len(self.groups):
+                return False
+                
+            group = self.groups[group_index]
+            master = group['master']
+            macs = [d['mac'] for d in devices]
+            
+            controller = self._controller(master['ip'])
+            success = controller.remove_zone_slaves(master['mac'], macs)
+            
+            if success:
+                group['slaves'] = [d for d in group['slaves'] if d['mac'] not in macs]
                 
             return success
         except Exception as e:
@@ -2469,9 +2958,14 @@ class SoundTouchGroupManager:
             return False
     
     def get_groups(self) -> List[dict]:
-        """Get list of all groups."""
+        """Get list of all groups (dicts with 'name', 'master' and 'slaves')."""
         return self.groups
     
+    @staticmethod
+    def group_devices(group: dict) -> List[dict]:
+        """All devices of a group, master first."""
+        return [group['master'], *group['slaves']]
+    
     def send_command_to_group(self, group_index: int, key: str) -> bool:
         """
         Send command to all devices in group.
@@ -2491,7 +2985,7 @@ class SoundTouchGroupManager:
             success = True
             
             # Send to master first
-            master_controller = SoundTouchController(group['master']['ip'])
+            master_controller = self._controller(group['master']['ip'])
             if not master_controller.send_key(key):
                 success = False
                 
@@ -2515,13 +3009,11 @@ class SoundTouchGroupManager:
                 return False
                 
             group = self.groups[group_index]
-            success = True
             
-            for device in group['all_devices']:
-                controller = SoundTouchController(device['ip'])
-                if not controller.set_volume(volume):
-                    success = False
-                    
-            return success
+            # One request per speaker, sent in parallel so the group changes together
+            def apply(device):
+                return self._controller(device['ip']).set_volume(volume)
+            
+            return all(_map_concurrently(apply, self.group_devices(group)))
         except Exception:
             return False
@@ -205,11 +205,13 @@ class SystemAudioCapture:
         if not self._start_http_server():
             return False
         
-        # Get local IP
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        local_ip = s.getsockname()[0]
-        s.close()
+        from soundtouch_lib import SoundTouchController, get_local_ip
+
+        local_ip = get_local_ip()
+        if not local_ip:
+            print("❌ Could not determine local IP address")
+            self._stop_http_server()
+            return False
         
         # Diagnose audio sources (Linux/PulseAudio; auf Windows harmlos)
         try:
@@ -237,7 +239,6 @@ class SystemAudioCapture:
         # FFmpeg will produce data within ~100ms
         
         # Tell Bose to play the stream via DLNA
-        from soundtouch_lib import SoundTouchController
         device = SoundTouchController(device_ip)
         
         success = device.play_url_dlna(